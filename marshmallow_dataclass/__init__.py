@@ -36,14 +36,16 @@ Full example::
 """
 
 import collections.abc
+import copy
 import dataclasses
 import inspect
 import sys
 import threading
 import types
 import warnings
+import weakref
 from enum import Enum
-from functools import lru_cache, partial
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -52,6 +54,7 @@ from typing import (
     Generic,
     List,
     Mapping,
+    NamedTuple,
     NewType as typing_NewType,
     Optional,
     Sequence,
@@ -69,6 +72,7 @@ import marshmallow
 import typing_extensions
 import typing_inspect
 
+from marshmallow_dataclass import collection_field
 from marshmallow_dataclass.lazy_class_attribute import lazy_class_attribute
 
 if sys.version_info >= (3, 9):
@@ -93,6 +97,13 @@ MEMBERS_WHITELIST: Set[str] = {"Meta"}
 # Max number of generated schemas that class_schema keeps of generated schemas. Removes duplicates.
 MAX_CLASS_SCHEMA_CACHE_SIZE = 1024
 
+_SchemaKey = Tuple[type, Optional[Type[marshmallow.Schema]]]
+
+# Generated schemas, keyed by (clazz, base_schema), least recently used first.
+_class_schema_cache: "collections.OrderedDict[_SchemaKey, Type[marshmallow.Schema]]" = (
+    collections.OrderedDict()
+)
+
 
 def _maybe_get_callers_frame(
     cls: type, stacklevel: int = 1
@@ -117,16 +128,14 @@ def _maybe_get_callers_frame(
     is a significant win, memory-wise.
 
     """
+    if not hasattr(sys, "_getframe"):
+        return None
     try:
-        frame = inspect.currentframe()
-        for _ in range(stacklevel + 1):
-            if frame is None:
-                return None
-            frame = frame.f_back
-
-        if frame is None:
-            return None
+        frame = sys._getframe(stacklevel + 1)
+    except ValueError:  # call stack is not deep enough
+        return None
 
+    try:
         globalns = getattr(sys.modules.get(cls.__module__), "__dict__", None)
         if frame.f_locals is globalns:
             # Locals are the globals
@@ -209,13 +218,15 @@ def dataclass(
     >>> Point.Schema().load({'x':0, 'y':0}) # This line can be statically type checked
     Point(x=0.0, y=0.0)
     """
-    dc = dataclasses.dataclass(
-        repr=repr, eq=eq, order=order, unsafe_hash=unsafe_hash, frozen=frozen
-    )
 
     def decorator(cls: Type[_U], stacklevel: int = 1) -> Type[_U]:
+        # Apply dataclasses.dataclass directly, rather than through the
+        # intermediate decorator it returns when called without a class
+        clazz = dataclasses.dataclass(
+            cls, repr=repr, eq=eq, order=order, unsafe_hash=unsafe_hash, frozen=frozen
+        )
         return add_schema(
-            dc(cls), base_schema, cls_frame=cls_frame, stacklevel=stacklevel + 1
+            clazz, base_schema, cls_frame=cls_frame, stacklevel=stacklevel + 1
         )
 
     if _cls is None:
@@ -455,27 +466,65 @@ def class_schema(
     """
     if not dataclasses.is_dataclass(clazz):
         clazz = dataclasses.dataclass(clazz)
+    # Skip the frame inspection when the schema has already been generated
+    cached = _get_cached_class_schema((clazz, base_schema))
+    if cached is not None:
+        return cached
     if localns is None:
         if clazz_frame is None:
             clazz_frame = _maybe_get_callers_frame(clazz)
         if clazz_frame is not None:
             localns = clazz_frame.f_locals
-    with _SchemaContext(globalns, localns):
-        return _internal_class_schema(clazz, base_schema)
+    with _SchemaContext(globalns, localns) as schema_ctx:
+        schema = _internal_class_schema(clazz, base_schema)
+        schema_ctx.cache_schemas()
+        return schema
 
 
 class _SchemaContext:
     """Global context for an invocation of class_schema."""
 
+    __slots__ = ("seen_classes", "schemas", "field_cache", "globalns", "localns")
+
     def __init__(
         self,
         globalns: Optional[Dict[str, Any]] = None,
         localns: Optional[Dict[str, Any]] = None,
     ):
-        self.seen_classes: Dict[type, str] = {}
+        self.seen_classes: Set[type] = set()
+        # Schemas generated in this context, keyed by (clazz, base_schema). They
+        # are added to the schema cache once the generation succeeded.
+        self.schemas: Dict[_SchemaKey, Type[marshmallow.Schema]] = {}
+        # Fields generated by _field_for_schema, keyed by the identity of its
+        # arguments: the type, the default, and the metadata names and values,
+        # plus the base schema. The first field generated for given arguments
+        # is kept, and later occurrences get a copy of it (marshmallow fields
+        # are stateful and must not be shared between schema attributes).
+        # Arguments are compared by identity rather than equality: Unions
+        # compare equal regardless of the order of their arguments, and equal
+        # values such as 1 and True, or 0.0 and -0.0, do not make equal fields.
+        self.field_cache: Dict[
+            Tuple[Any, ...], Tuple[Tuple[Any, ...], marshmallow.fields.Field]
+        ] = {}
         self.globalns = globalns
         self.localns = localns
 
+    def cache_schemas(self) -> None:
+        """
+        Add the schemas generated in this context to the schema cache.
+
+        This must only be called once the generation succeeded: the schemas of
+        recursive dataclasses refer to each other through this context, so a
+        failed generation leaves schemas that cannot be resolved.
+        """
+        _class_schema_cache.update(self.schemas)
+        while len(_class_schema_cache) > MAX_CLASS_SCHEMA_CACHE_SIZE:
+            try:
+                # Evict the least recently used entry
+                _class_schema_cache.popitem(last=False)
+            except KeyError:  # emptied by another thread
+                break
+
     def __enter__(self) -> "_SchemaContext":
         _schema_ctx_stack.push(self)
         return self
@@ -507,20 +556,35 @@ class _LocalStack(threading.local, Generic[_U]):
 _schema_ctx_stack = _LocalStack[_SchemaContext]()
 
 
-@lru_cache(maxsize=MAX_CLASS_SCHEMA_CACHE_SIZE)
 def _internal_class_schema(
     clazz: type,
     base_schema: Optional[Type[marshmallow.Schema]] = None,
 ) -> Type[marshmallow.Schema]:
-    schema_ctx = _schema_ctx_stack.top
+    key = (clazz, base_schema)
+    schemas = _schema_ctx_stack.top.schemas
+    schema = schemas.get(key) or _get_cached_class_schema(key)
+    if schema is None:
+        schema = _build_class_schema(clazz, base_schema)
+        schemas[key] = schema
+    return schema
+
+
+def _get_cached_class_schema(key: _SchemaKey) -> Optional[Type[marshmallow.Schema]]:
+    schema = _class_schema_cache.get(key)
+    if schema is not None:
+        try:
+            _class_schema_cache.move_to_end(key)
+        except KeyError:  # evicted by another thread in the meantime
+            pass
+    return schema
 
-    if typing_extensions.get_origin(clazz) is Annotated and sys.version_info < (3, 10):
-        # https://github.com/python/cpython/blob/3.10/Lib/typing.py#L977
-        class_name = clazz._name or clazz.__origin__.__name__  # type: ignore[attr-defined]
-    else:
-        class_name = clazz.__name__
 
-    schema_ctx.seen_classes[clazz] = class_name
+def _build_class_schema(
+    clazz: type,
+    base_schema: Optional[Type[marshmallow.Schema]] = None,
+) -> Type[marshmallow.Schema]:
+    schema_ctx = _schema_ctx_stack.top
+    schema_ctx.seen_classes.add(clazz)
 
     try:
         # noinspection PyDataclass
@@ -546,11 +610,7 @@ def _internal_class_schema(
             ) from exc
 
     # Copy all marshmallow hooks and whitelisted members of the dataclass to the schema.
-    attributes = {
-        k: v
-        for k, v in inspect.getmembers(clazz)
-        if hasattr(v, "__marshmallow_hook__") or k in MEMBERS_WHITELIST
-    }
+    attributes = _marshmallow_hooks(clazz)
 
     # Determine whether we should include non-init fields
     include_non_init = getattr(getattr(clazz, "Meta", None), "include_non_init", False)
@@ -568,30 +628,105 @@ def _internal_class_schema(
         type_hints = get_type_hints(
             clazz, globalns=schema_ctx.globalns, localns=schema_ctx.localns
         )
-    attributes.update(
-        (
-            field.name,
-            _field_for_schema(
-                type_hints[field.name],
-                _get_field_default(field),
-                field.metadata,
-                base_schema,
-            ),
+    if not include_non_init:
+        fields = tuple([field for field in fields if field.init])
+    for field in fields:
+        # Convert the dataclass default into a marshmallow default
+        # Remove `type: ignore` when https://github.com/python/mypy/issues/6910 is fixed
+        default: Any = field.default_factory  # type: ignore
+        if default is dataclasses.MISSING:
+            default = field.default
+            if default is dataclasses.MISSING:
+                default = marshmallow.missing
+        attributes[field.name] = _field_for_schema(
+            type_hints[field.name], default, field.metadata, base_schema
         )
-        for field in fields
-        if field.init or include_non_init
-    )
 
     schema_class = type(clazz.__name__, (_base_schema(clazz, base_schema),), attributes)
     return cast(Type[marshmallow.Schema], schema_class)
 
 
+def _marshmallow_hooks(clazz: type) -> Dict[str, Any]:
+    """
+    Return the marshmallow hooks and whitelisted members of a class, including
+    the ones it inherits.
+
+    This only looks at the names defined in the ``__dict__`` of the classes of the
+    MRO, instead of calling ``getattr`` for every name in ``dir(clazz)`` as
+    :func:`inspect.getmembers` does.
+    """
+    members: Dict[str, Any] = {}
+    seen: Set[str] = set()
+    for base in clazz.__mro__[:-1]:  # object defines no hooks
+        for name, value in vars(base).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if name in MEMBERS_WHITELIST or hasattr(value, "__marshmallow_hook__"):
+                members[name] = getattr(clazz, name)
+    return members
+
+
+class _TypeInfo(NamedTuple):
+    origin: Any
+    args: Tuple[Any, ...]
+    is_union: bool
+    is_optional: bool
+    is_literal: bool
+    is_final: bool
+
+
+# Max number of types for which _type_info keeps the typing information.
+_MAX_TYPE_INFO_CACHE_SIZE = 1024
+
+# Typing information of the types seen by _type_info, keyed by id(typ).
+_type_info_cache: "collections.OrderedDict[int, Tuple[Any, _TypeInfo]]" = (
+    collections.OrderedDict()
+)
+
+
+def _type_info(typ: Any) -> _TypeInfo:
+    """
+    Return the origin and arguments of a type, and which of the special forms
+    handled by _new_field_for_schema (Union, Optional, Literal, Final) it is.
+
+    These are pure functions of the type, and are needed for every field of that
+    type, so they are computed once per type.
+
+    Types are compared by identity rather than equality: Unions compare equal
+    regardless of the order of their arguments, which matters here. (Generic
+    aliases are cached by the typing module, so identity is the common case.)
+    """
+    cached = _type_info_cache.get(id(typ))
+    if cached is not None and cached[0] is typ:
+        return cached[1]
+    type_info = _TypeInfo(
+        origin=typing_extensions.get_origin(typ),
+        args=typing_extensions.get_args(typ),
+        is_union=typing_inspect.is_union_type(typ),
+        is_optional=typing_inspect.is_optional_type(typ),
+        is_literal=typing_inspect.is_literal_type(typ),
+        is_final=typing_inspect.is_final_type(typ),
+    )
+    # Keep a reference to typ so that its id is not reused
+    _type_info_cache[id(typ)] = (typ, type_info)
+    while len(_type_info_cache) > _MAX_TYPE_INFO_CACHE_SIZE:
+        try:
+            # Evict the oldest entry
+            _type_info_cache.popitem(last=False)
+        except KeyError:  # emptied by another thread
+            break
+    return type_info
+
+
 def _field_by_type(
     typ: Union[type, Any], base_schema: Optional[Type[marshmallow.Schema]]
 ) -> Optional[Type[marshmallow.fields.Field]]:
-    return (
-        base_schema and base_schema.TYPE_MAPPING.get(typ)
-    ) or marshmallow.Schema.TYPE_MAPPING.get(typ)
+    if base_schema is not None:
+        field = base_schema.TYPE_MAPPING.get(typ)
+        if field is not None:
+            return field
+    return marshmallow.Schema.TYPE_MAPPING.get(typ)
 
 
 def _field_by_supertype(
@@ -647,84 +782,134 @@ def _generic_type_add_any(typ: type) -> type:
         typ = Set[Any]
     elif typ is frozenset or typ is FrozenSet:
         typ = FrozenSet[Any]
+    elif typ is Tuple:
+        typ = Tuple[Any, ...]  # type: ignore[assignment]
     return typ
 
 
+def _field_for_list(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    list_type = cast(
+        Type[marshmallow.fields.List],
+        type_mapping.get(List, marshmallow.fields.List),
+    )
+    return list_type(child_type, **metadata)
+
+
+def _field_for_sequence(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Sequence(cls_or_instance=child_type, **metadata)
+
+
+def _field_for_set(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Set(cls_or_instance=child_type, frozen=False, **metadata)
+
+
+def _field_for_frozenset(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    child_type = _field_for_schema(arguments[0], base_schema=base_schema)
+    return collection_field.Set(cls_or_instance=child_type, frozen=True, **metadata)
+
+
+def _field_for_tuple(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    if len(arguments) == 2 and arguments[1] is Ellipsis:
+        # Homogeneous tuple of arbitrary length, i.e. Tuple[int, ...]
+        return _field_for_sequence(arguments, base_schema, type_mapping, metadata)
+    children = tuple(
+        [_field_for_schema(arg, base_schema=base_schema) for arg in arguments]
+    )
+    tuple_type = cast(
+        Type[marshmallow.fields.Tuple],
+        type_mapping.get(  # type:ignore[call-overload]
+            Tuple, marshmallow.fields.Tuple
+        ),
+    )
+    return tuple_type(children, **metadata)
+
+
+def _field_for_mapping(
+    arguments: Tuple[Any, ...],
+    base_schema: Optional[Type[marshmallow.Schema]],
+    type_mapping: Mapping[Any, Type[marshmallow.fields.Field]],
+    metadata: Dict[str, Any],
+) -> marshmallow.fields.Field:
+    dict_type = type_mapping.get(Dict, marshmallow.fields.Dict)
+    return dict_type(
+        keys=_field_for_schema(arguments[0], base_schema=base_schema),
+        values=_field_for_schema(arguments[1], base_schema=base_schema),
+        **metadata,
+    )
+
+
+# Field builders for the generic types, keyed by the origin of the type.
+_GENERIC_FIELD_BUILDERS: Dict[Any, Callable[..., marshmallow.fields.Field]] = {
+    list: _field_for_list,
+    List: _field_for_list,
+    collections.abc.Sequence: _field_for_sequence,
+    Sequence: _field_for_sequence,
+    set: _field_for_set,
+    Set: _field_for_set,
+    frozenset: _field_for_frozenset,
+    FrozenSet: _field_for_frozenset,
+    tuple: _field_for_tuple,
+    Tuple: _field_for_tuple,
+    dict: _field_for_mapping,
+    Dict: _field_for_mapping,
+    collections.abc.Mapping: _field_for_mapping,
+    Mapping: _field_for_mapping,
+}
+
+
 def _field_for_generic_type(
     typ: type,
     base_schema: Optional[Type[marshmallow.Schema]],
-    **metadata: Any,
+    metadata: Dict[str, Any],
 ) -> Optional[marshmallow.fields.Field]:
     """
     If the type is a generic interface, resolve the arguments and construct the appropriate Field.
     """
-    origin = typing_extensions.get_origin(typ)
-    arguments = typing_extensions.get_args(typ)
-    if origin:
-        # Override base_schema.TYPE_MAPPING to change the class used for generic types below
-        type_mapping = base_schema.TYPE_MAPPING if base_schema else {}
-
-        if origin in (list, List):
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            list_type = cast(
-                Type[marshmallow.fields.List],
-                type_mapping.get(List, marshmallow.fields.List),
-            )
-            return list_type(child_type, **metadata)
-        if origin in (collections.abc.Sequence, Sequence) or (
-            origin in (tuple, Tuple)
-            and len(arguments) == 2
-            and arguments[1] is Ellipsis
-        ):
-            from . import collection_field
-
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Sequence(cls_or_instance=child_type, **metadata)
-        if origin in (set, Set):
-            from . import collection_field
-
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Set(
-                cls_or_instance=child_type, frozen=False, **metadata
-            )
-        if origin in (frozenset, FrozenSet):
-            from . import collection_field
-
-            child_type = _field_for_schema(arguments[0], base_schema=base_schema)
-            return collection_field.Set(
-                cls_or_instance=child_type, frozen=True, **metadata
-            )
-        if origin in (tuple, Tuple):
-            children = tuple(
-                _field_for_schema(arg, base_schema=base_schema) for arg in arguments
-            )
-            tuple_type = cast(
-                Type[marshmallow.fields.Tuple],
-                type_mapping.get(  # type:ignore[call-overload]
-                    Tuple, marshmallow.fields.Tuple
-                ),
-            )
-            return tuple_type(children, **metadata)
-        elif origin in (dict, Dict, collections.abc.Mapping, Mapping):
-            dict_type = type_mapping.get(Dict, marshmallow.fields.Dict)
-            return dict_type(
-                keys=_field_for_schema(arguments[0], base_schema=base_schema),
-                values=_field_for_schema(arguments[1], base_schema=base_schema),
-                **metadata,
-            )
-
-    return None
+    type_info = _type_info(typ)
+    builder = _GENERIC_FIELD_BUILDERS.get(type_info.origin)
+    if builder is None:
+        return None
+    # Override base_schema.TYPE_MAPPING to change the class used for generic types
+    type_mapping = base_schema.TYPE_MAPPING if base_schema else {}
+    return builder(type_info.args, base_schema, type_mapping, metadata)
 
 
 def _field_for_annotated_type(
     typ: type,
-    **metadata: Any,
+    metadata: Dict[str, Any],
 ) -> Optional[marshmallow.fields.Field]:
     """
     If the type is an Annotated interface, resolve the arguments and construct the appropriate Field.
     """
-    origin = typing_extensions.get_origin(typ)
-    arguments = typing_extensions.get_args(typ)
+    origin, arguments = _type_info(typ)[:2]
     if origin and origin is Annotated:
         marshmallow_annotations = [
             arg
@@ -750,11 +935,12 @@ def _field_for_annotated_type(
 def _field_for_union_type(
     typ: type,
     base_schema: Optional[Type[marshmallow.Schema]],
-    **metadata: Any,
+    metadata: Dict[str, Any],
 ) -> Optional[marshmallow.fields.Field]:
-    arguments = typing_extensions.get_args(typ)
-    if typing_inspect.is_union_type(typ):
-        if typing_inspect.is_optional_type(typ):
+    type_info = _type_info(typ)
+    if type_info.is_union:
+        arguments = type_info.args
+        if NoneType in arguments:
             metadata["allow_none"] = metadata.get("allow_none", True)
             metadata["dump_default"] = metadata.get("dump_default", None)
             if not metadata.get("required"):
@@ -767,6 +953,7 @@ def _field_for_union_type(
                 metadata=metadata,
                 base_schema=base_schema,
             )
+        # Imported here: union_field pulls in typeguard, which is slow to import
         from . import union_field
 
         return union_field.Union(
@@ -786,6 +973,36 @@ def _field_for_union_type(
     return None
 
 
+# Literal types with more values than this are validated with a set lookup
+# rather than by scanning the values.
+_MAX_SCANNED_LITERAL_VALUES = 8
+
+
+class _SetOneOf(marshmallow.validate.OneOf):
+    """A OneOf validator that checks membership in a frozenset of the choices."""
+
+    def __init__(self, choices: Tuple[Any, ...]):
+        super().__init__(choices)
+        self._choice_set = frozenset(choices)
+
+    def __call__(self, value: Any) -> Any:
+        try:
+            if value not in self._choice_set:
+                raise marshmallow.ValidationError(self._format_error(value))
+        except TypeError as error:
+            # Unhashable values are not one of the choices either
+            raise marshmallow.ValidationError(self._format_error(value)) from error
+        return value
+
+
+def _literal_validator(arguments: Tuple[Any, ...]) -> marshmallow.validate.Validator:
+    if len(arguments) == 1:
+        return marshmallow.validate.Equal(arguments[0])
+    if len(arguments) > _MAX_SCANNED_LITERAL_VALUES:
+        return _SetOneOf(arguments)
+    return marshmallow.validate.OneOf(arguments)
+
+
 def field_for_schema(
     typ: type,
     default: Any = marshmallow.missing,
@@ -814,8 +1031,12 @@ def field_for_schema(
     >>> field_for_schema(str, metadata={"marshmallow_field": marshmallow.fields.Url()}).__class__
     <class 'marshmallow.fields.Url'>
     """
-    with _SchemaContext(localns=typ_frame.f_locals if typ_frame is not None else None):
-        return _field_for_schema(typ, default, metadata, base_schema)
+    with _SchemaContext(
+        localns=typ_frame.f_locals if typ_frame is not None else None
+    ) as schema_ctx:
+        field = _field_for_schema(typ, default, metadata, base_schema)
+        schema_ctx.cache_schemas()
+        return field
 
 
 def _field_for_schema(
@@ -837,6 +1058,86 @@ def _field_for_schema(
     :param base_schema: marshmallow schema used as a base class when deriving dataclass schema
 
     """
+    if (metadata and metadata.get("marshmallow_field")) or _infers_final_type(
+        typ, default
+    ):
+        # Fields defined by the user are used as is, and the type inference
+        # warning of Final has to be issued for every attribute: don't cache.
+        return _new_field_for_schema(typ, default, metadata, base_schema)
+
+    field_cache = _schema_ctx_stack.top.field_cache
+    metadata_values = tuple(metadata.values()) if metadata else ()
+    key = (
+        id(typ),
+        id(default),
+        tuple(metadata) if metadata else (),
+        tuple(map(id, metadata_values)),
+        base_schema,
+    )
+    cached = field_cache.get(key)
+    if cached is not None:
+        return _copy_field(cached[1])
+    field = _new_field_for_schema(typ, default, metadata, base_schema)
+    # Keep references to the arguments so that their ids are not reused
+    field_cache[key] = ((typ, default, metadata_values), field)
+    return field
+
+
+def _infers_final_type(typ: type, default: Any) -> bool:
+    """
+    Whether the type of a Final attribute is inferred from its default.
+    """
+    if default is marshmallow.missing:
+        return False
+    type_info = _type_info(typ)
+    return type_info.is_final and not type_info.args
+
+
+def _copy_field(field: marshmallow.fields.Field) -> marshmallow.fields.Field:
+    """
+    Return a copy of a cached field, that marshmallow sees as a newly created field.
+
+    Field.__deepcopy__ only makes a shallow copy, so the copy gets its own
+    containers here (metadata, validators, error messages, inner fields...).
+    """
+    field_copy = copy.copy(field)
+    for name, value in vars(field).items():
+        value_copy = _copy_field_attribute(value)
+        if value_copy is not value:
+            vars(field_copy)[name] = value_copy
+    if hasattr(field, "_creation_index"):
+        # marshmallow < 4 orders the fields of ordered schemas by creation index
+        field_copy._creation_index = (  # type: ignore[attr-defined]
+            marshmallow.fields.Field._creation_index  # type: ignore[attr-defined]
+        )
+        marshmallow.fields.Field._creation_index += 1  # type: ignore[attr-defined]
+    return field_copy
+
+
+def _copy_field_attribute(value: Any) -> Any:
+    if isinstance(value, marshmallow.fields.Field):
+        return _copy_field(value)
+    if type(value) is list:
+        return [_copy_field_attribute(item) for item in value]
+    if type(value) is dict:
+        return {key: _copy_field_attribute(item) for key, item in value.items()}
+    if type(value) is tuple and any(
+        isinstance(item, marshmallow.fields.Field) for item in value
+    ):
+        return tuple(_copy_field_attribute(item) for item in value)
+    return value
+
+
+def _new_field_for_schema(
+    typ: type,
+    default: Any = marshmallow.missing,
+    metadata: Optional[Mapping[str, Any]] = None,
+    base_schema: Optional[Type[marshmallow.Schema]] = None,
+) -> marshmallow.fields.Field:
+    # If the field was already defined by the user
+    predefined_field = metadata.get("marshmallow_field") if metadata else None
+    if predefined_field:
+        return predefined_field
 
     metadata = {} if metadata is None else dict(metadata)
 
@@ -846,40 +1147,32 @@ def _field_for_schema(
         if not metadata.get("required"):
             metadata.setdefault("load_default", default)
     else:
-        metadata.setdefault("required", not typing_inspect.is_optional_type(typ))
-
-    # If the field was already defined by the user
-    predefined_field = metadata.get("marshmallow_field")
-    if predefined_field:
-        return predefined_field
+        metadata.setdefault("required", not _type_info(typ).is_optional)
 
     # Generic types specified without type arguments
     typ = _generic_type_add_any(typ)
 
     # Base types
     field = _field_by_type(typ, base_schema)
-    if field:
+    if field is not None:
         return field(**metadata)
 
     if typ is Any:
         metadata.setdefault("allow_none", True)
         return marshmallow.fields.Raw(**metadata)
 
+    type_info = _type_info(typ)
+
     # i.e.: Literal['abc']
-    if typing_inspect.is_literal_type(typ):
-        arguments = typing_inspect.get_args(typ)
+    if type_info.is_literal:
+        arguments = type_info.args
         return marshmallow.fields.Raw(
-            validate=(
-                marshmallow.validate.Equal(arguments[0])
-                if len(arguments) == 1
-                else marshmallow.validate.OneOf(arguments)
-            ),
-            **metadata,
+            validate=_literal_validator(arguments), **metadata
         )
 
     # i.e.: Final[str] = 'abc'
-    if typing_inspect.is_final_type(typ):
-        arguments = typing_inspect.get_args(typ)
+    if type_info.is_final:
+        arguments = type_info.args
         if arguments:
             subtyp = arguments[0]
         elif default is not marshmallow.missing:
@@ -912,59 +1205,95 @@ def _field_for_schema(
             subtyp = Any
         return _field_for_schema(subtyp, default, metadata, base_schema)
 
-    annotated_field = _field_for_annotated_type(typ, **metadata)
+    annotated_field = _field_for_annotated_type(typ, metadata)
     if annotated_field:
         return annotated_field
 
-    union_field = _field_for_union_type(typ, base_schema, **metadata)
+    union_field = _field_for_union_type(typ, base_schema, metadata)
     if union_field:
         return union_field
 
     # Generic types
-    generic_field = _field_for_generic_type(typ, base_schema, **metadata)
+    generic_field = _field_for_generic_type(typ, base_schema, metadata)
     if generic_field:
         return generic_field
 
-    # typing.NewType returns a function (in python <= 3.9) or a class (python >= 3.10) with a
-    # __supertype__ attribute
-    newtype_supertype = getattr(typ, "__supertype__", None)
-    if typing_inspect.is_new_type(typ) and newtype_supertype is not None:
-        return _field_by_supertype(
-            typ=typ,
-            default=default,
-            newtype_supertype=newtype_supertype,
-            metadata=metadata,
-            base_schema=base_schema,
-        )
+    forward_reference = None
+    if isinstance(typ, type):
+        # enumerations
+        if issubclass(typ, Enum):
+            return marshmallow.fields.Enum(typ, **metadata)
+    else:
+        # Neither NewTypes nor forward references are classes, so there is no need to
+        # probe for their attributes on the (common) nested dataclass path.
+
+        # typing.NewType returns a function (in python <= 3.9) or a class (python >= 3.10)
+        # with a __supertype__ attribute
+        newtype_supertype = getattr(typ, "__supertype__", None)
+        if typing_inspect.is_new_type(typ) and newtype_supertype is not None:
+            return _field_by_supertype(
+                typ=typ,
+                default=default,
+                newtype_supertype=newtype_supertype,
+                metadata=metadata,
+                base_schema=base_schema,
+            )
 
-    # enumerations
-    if inspect.isclass(typ) and issubclass(typ, Enum):
-        return marshmallow.fields.Enum(typ, **metadata)
+        # Nested dataclasses
+        forward_reference = getattr(typ, "__forward_arg__", None)
 
     # Nested marshmallow dataclass
     # it would be just a class name instead of actual schema util the schema is not ready yet
     nested_schema = getattr(typ, "Schema", None)
 
-    # Nested dataclasses
-    forward_reference = getattr(typ, "__forward_arg__", None)
-
     nested = (
         nested_schema
         or forward_reference
-        or _schema_ctx_stack.top.seen_classes.get(typ)
-        or _internal_class_schema(typ, base_schema)  # type: ignore[arg-type] # FIXME
+        or _schema_for_nested(typ, base_schema)  # type: ignore[arg-type] # FIXME
     )
 
     return marshmallow.fields.Nested(nested, **metadata)
 
 
+def _schema_for_nested(
+    clazz: type, base_schema: Optional[Type[marshmallow.Schema]] = None
+) -> Union[Type[marshmallow.Schema], Callable[[], Type[marshmallow.Schema]]]:
+    """
+    Return the schema to use for a nested dataclass field.
+    """
+    schemas = _schema_ctx_stack.top.schemas
+    key = (clazz, base_schema)
+    if clazz in _schema_ctx_stack.top.seen_classes and key not in schemas:
+        # Recursive reference: the schema of clazz is still being generated.
+        # Resolve it on first use to the schema generated in this context, rather
+        # than by class name, which marshmallow has to look up in its class
+        # registry, or through the schema cache, which may have evicted it by then.
+        return lambda: schemas[key]
+    return _internal_class_schema(clazz, base_schema)
+
+
+# BaseSchema classes created by _base_schema, keyed by (clazz, base_schema). They
+# are only weakly referenced: an entry lives as long as a schema derived from it.
+_base_schemas: "weakref.WeakValueDictionary[_SchemaKey, Type[marshmallow.Schema]]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 def _base_schema(
     clazz: type, base_schema: Optional[Type[marshmallow.Schema]] = None
 ) -> Type[marshmallow.Schema]:
     """
     Base schema factory that creates a schema for `clazz` derived either from `base_schema`
     or `BaseSchema`
+
+    The created class only depends on its arguments, so it is created once per
+    (clazz, base_schema), even if the schema of `clazz` has to be regenerated
+    while the previous one is still in use.
     """
+    key = (clazz, base_schema)
+    cached = _base_schemas.get(key)
+    if cached is not None:
+        return cached
 
     # Remove `type: ignore` when mypy handles dynamic base classes
     # https://github.com/python/mypy/issues/2813
@@ -977,23 +1306,7 @@ def _base_schema(
             else:
                 return clazz(**all_loaded)
 
-    return BaseSchema
-
-
-def _get_field_default(field: dataclasses.Field):
-    """
-    Return a marshmallow default value given a dataclass default value
-
-    >>> _get_field_default(dataclasses.field())
-    <marshmallow.missing>
-    """
-    # Remove `type: ignore` when https://github.com/python/mypy/issues/6910 is fixed
-    default_factory = field.default_factory  # type: ignore
-    if default_factory is not dataclasses.MISSING:
-        return default_factory
-    elif field.default is dataclasses.MISSING:
-        return marshmallow.missing
-    return field.default
+    return _base_schemas.setdefault(key, BaseSchema)
 
 
 def NewType(
@@ -26,6 +26,35 @@ class TestAttributesCopy(unittest.TestCase):
         schema = class_schema(Anything)
         self.assertIn("validates_schema", dir(schema))
 
+    def test_inherited_hook_copied(self):
+        @dataclasses.dataclass
+        class Base:
+            @marshmallow.validates_schema
+            def validates_schema(self, *args, **kwargs):
+                pass
+
+        @dataclasses.dataclass
+        class Anything(Base):
+            pass
+
+        schema = class_schema(Anything)
+        self.assertIn("validates_schema", dir(schema))
+
+    def test_overridden_hook_not_copied(self):
+        @dataclasses.dataclass
+        class Base:
+            @marshmallow.validates_schema
+            def validates_schema(self, *args, **kwargs):
+                pass
+
+        @dataclasses.dataclass
+        class Anything(Base):
+            def validates_schema(self, *args, **kwargs):
+                pass
+
+        schema = class_schema(Anything)
+        self.assertNotIn("validates_schema", dir(schema))
+
     def test_custom_method_not_copied(self):
         @dataclasses.dataclass
         class Anything:
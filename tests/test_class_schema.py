@@ -1,6 +1,10 @@
+import gc
 import inspect
 import typing
 import unittest
+import warnings
+import weakref
+from unittest import mock
 from typing import Any, cast, TYPE_CHECKING
 from uuid import UUID
 
@@ -10,10 +14,11 @@ except ImportError:
     from typing_extensions import Final, Literal  # type: ignore[assignment]
 
 import dataclasses
-from marshmallow import Schema, ValidationError
+from marshmallow import Schema, ValidationError, class_registry
 from marshmallow.fields import Field, UUID as UUIDField, List as ListField, Integer
-from marshmallow.validate import Validator
+from marshmallow.validate import Length, Validator
 
+import marshmallow_dataclass
 from marshmallow_dataclass import class_schema, NewType
 
 
@@ -97,6 +102,158 @@ class TestClassSchema(unittest.TestCase):
         self.assertEqual(len(complex_set), 1)
         self.assertEqual(len(simple_set), 1)
 
+    def test_cached_schema_skips_frame_lookup(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: str
+
+        schema = class_schema(Simple)
+        with mock.patch(
+            "marshmallow_dataclass._maybe_get_callers_frame"
+        ) as get_callers_frame:
+            self.assertIs(class_schema(Simple), schema)
+        get_callers_frame.assert_not_called()
+
+    def test_schema_cache_evicts_least_recently_used(self):
+        @dataclasses.dataclass
+        class A:
+            x: int
+
+        @dataclasses.dataclass
+        class B:
+            x: int
+
+        @dataclasses.dataclass
+        class C:
+            x: int
+
+        with mock.patch.dict(
+            marshmallow_dataclass._class_schema_cache, clear=True
+        ), mock.patch("marshmallow_dataclass.MAX_CLASS_SCHEMA_CACHE_SIZE", 2):
+            schema_a = class_schema(A)
+            schema_b = class_schema(B)
+            class_schema(A)
+            class_schema(C)
+            self.assertIs(class_schema(A), schema_a)
+            self.assertIsNot(class_schema(B), schema_b)
+
+    def test_uncached_schema_does_not_keep_class_alive(self):
+        def make_schema():
+            @dataclasses.dataclass
+            class Simple:
+                x: int
+
+            class_schema(Simple)
+            return weakref.ref(Simple)
+
+        with mock.patch.dict(
+            marshmallow_dataclass._class_schema_cache, clear=True
+        ), mock.patch.dict(class_registry._registry, clear=True):
+            simple_ref = make_schema()
+            marshmallow_dataclass._class_schema_cache.clear()
+            class_registry._registry.clear()
+            gc.collect()
+            gc.collect()
+            self.assertIsNone(simple_ref())
+
+    def test_repeated_field_types_get_distinct_fields(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: typing.List[int]
+            two: typing.List[int]
+
+        declared_fields = class_schema(Simple)._declared_fields
+        self.assertIsNot(declared_fields["one"], declared_fields["two"])
+        self.assertEqual(
+            class_schema(Simple)().load({"one": [1], "two": [2]}),
+            Simple(one=[1], two=[2]),
+        )
+
+    def test_repeated_field_metadata_gets_distinct_fields(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: typing.Any = dataclasses.field(metadata={"dump_default": 1})
+            two: typing.Any = dataclasses.field(metadata={"dump_default": 1})
+            three: typing.Any = dataclasses.field(metadata={"dump_default": True})
+
+        declared_fields = class_schema(Simple)._declared_fields
+        self.assertIsNot(declared_fields["one"], declared_fields["two"])
+        self.assertEqual(
+            class_schema(Simple)().dump({}), {"one": 1, "two": 1, "three": True}
+        )
+        self.assertIs(class_schema(Simple)().dump({})["three"], True)
+
+    def test_repeated_field_defaults_get_distinct_fields(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: float = 0.0
+            two: float = 0.0
+            three: float = -0.0
+
+        declared_fields = class_schema(Simple)._declared_fields
+        self.assertIsNot(declared_fields["one"], declared_fields["two"])
+        dumped = class_schema(Simple)().dump({})
+        self.assertEqual(
+            [str(dumped[name]) for name in ("one", "two", "three")],
+            ["0.0", "0.0", "-0.0"],
+        )
+
+    def test_repeated_field_types_do_not_share_state(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: typing.List[int]
+            two: typing.List[int]
+
+        declared_fields = class_schema(Simple)._declared_fields
+        one, two = declared_fields["one"], declared_fields["two"]
+        one.metadata["description"] = "one"
+        one.validators.append(Length(min=1))
+        one.error_messages["empty"] = "Empty list."
+        self.assertNotIn("description", two.metadata)
+        self.assertEqual(two.validators, [])
+        self.assertNotIn("empty", two.error_messages)
+        self.assertIsNot(one.inner, two.inner)
+
+    def test_predefined_field_is_used_as_is(self):
+        predefined = Integer()
+
+        @dataclasses.dataclass
+        class Simple:
+            one: int = dataclasses.field(metadata={"marshmallow_field": predefined})
+            two: int = dataclasses.field(metadata={"marshmallow_field": predefined})
+
+        declared_fields = class_schema(Simple)._declared_fields
+        self.assertIs(declared_fields["one"], predefined)
+        self.assertIs(declared_fields["two"], predefined)
+
+    def test_ordered_schema_with_repeated_field_types(self):
+        @dataclasses.dataclass
+        class Simple:
+            class Meta:
+                ordered = True
+
+            a: int
+            b: str
+            c: int
+            d: str
+
+        schema = class_schema(Simple)()
+        self.assertEqual(list(schema.fields), ["a", "b", "c", "d"])
+        self.assertEqual(
+            list(schema.dump(Simple(a=1, b="b", c=2, d="d"))), ["a", "b", "c", "d"]
+        )
+
+    def test_union_field_order_is_kept_per_field(self):
+        @dataclasses.dataclass
+        class Simple:
+            one: typing.Union[int, str]
+            two: typing.Union[str, int]
+
+        self.assertEqual(
+            class_schema(Simple)().load({"one": "1", "two": "1"}),
+            Simple(one=1, two="1"),
+        )
+
     def test_use_type_mapping_from_base_schema(self):
         class CustomType:
             pass
@@ -211,6 +368,18 @@ class TestClassSchema(unittest.TestCase):
             with self.assertRaises(ValidationError):
                 schema.load({"data": data})
 
+    def test_literal_many_values(self):
+        @dataclasses.dataclass
+        class A:
+            data: Literal["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", 1]
+
+        schema = class_schema(A)()
+        for data in ["a", "j", 1]:
+            self.assertEqual(A(data=data), schema.load({"data": data}))
+        for data in ["k", 2, ["a"], {"a": 1}]:
+            with self.assertRaises(ValidationError):
+                schema.load({"data": data})
+
     def test_final(self):
         @dataclasses.dataclass
         class A:
@@ -268,6 +437,21 @@ class TestClassSchema(unittest.TestCase):
             with self.assertRaises(ValidationError):
                 schema_b.load({"data": data})
 
+    def test_final_infers_type_from_default_warns_per_attribute(self):
+        class A:
+            one: Final = 1
+            two: Final = 1
+
+        # NOTE: This workaround is needed to avoid a Mypy crash.
+        # See: https://github.com/python/mypy/issues/10090#issuecomment-865971891
+        if not TYPE_CHECKING:
+            A = dataclasses.dataclass(A)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            class_schema(A)
+        self.assertEqual(len(caught), 2)
+
     def test_final_infers_type_any_from_field_default_factory(self):
         # @dataclasses.dataclass
         class A:
@@ -413,6 +597,83 @@ class TestClassSchema(unittest.TestCase):
             Tree(children=[Tree(children=[])]),
         )
 
+    def test_recursive_reference_with_clashing_class_names(self):
+        def make_tree(value_type):
+            @dataclasses.dataclass
+            class Tree:
+                value: value_type
+                children: typing.List["Tree"]  # noqa: F821
+
+            return Tree
+
+        IntTree = make_tree(int)
+        StrTree = make_tree(str)
+
+        self.assertEqual(
+            class_schema(IntTree, localns={"Tree": IntTree})().load(
+                {"value": 1, "children": [{"value": 2, "children": []}]}
+            ),
+            IntTree(value=1, children=[IntTree(value=2, children=[])]),
+        )
+        self.assertEqual(
+            class_schema(StrTree, localns={"Tree": StrTree})().load(
+                {"value": "a", "children": [{"value": "b", "children": []}]}
+            ),
+            StrTree(value="a", children=[StrTree(value="b", children=[])]),
+        )
+
+    def test_recursive_reference_survives_cache_eviction(self):
+        @dataclasses.dataclass
+        class Node:
+            kids: typing.List["Node"]  # noqa: F821
+
+        with mock.patch.dict(
+            marshmallow_dataclass._class_schema_cache, clear=True
+        ), mock.patch("marshmallow_dataclass.MAX_CLASS_SCHEMA_CACHE_SIZE", 3):
+            schema = class_schema(Node)
+            for _ in range(5):
+
+                @dataclasses.dataclass
+                class Other:
+                    x: int
+
+                class_schema(Other)
+
+        self.assertEqual(
+            schema().load({"kids": [{"kids": []}]}), Node(kids=[Node(kids=[])])
+        )
+        self.assertIs(type(schema().fields["kids"].inner.schema), schema)
+
+    def test_failed_generation_is_not_cached(self):
+        @dataclasses.dataclass
+        class A:
+            b: "B"
+            c: "C"
+
+        @dataclasses.dataclass
+        class B:
+            a: typing.Optional[A]
+
+        @dataclasses.dataclass
+        class C:
+            d: "D"
+
+        with self.assertRaises(NameError):
+            class_schema(A)
+
+        @dataclasses.dataclass
+        class D:
+            x: int
+
+        self.assertEqual(
+            class_schema(A)().load({"b": {"a": None}, "c": {"d": {"x": 1}}}),
+            A(b=B(a=None), c=C(d=D(x=1))),
+        )
+        self.assertEqual(
+            class_schema(B)().load({"a": {"b": {"a": None}, "c": {"d": {"x": 1}}}}),
+            B(a=A(b=B(a=None), c=C(d=D(x=1)))),
+        )
+
     def test_cyclic_reference(self):
         @dataclasses.dataclass
         class First:
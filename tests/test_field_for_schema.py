@@ -297,6 +297,14 @@ class TestFieldForSchema(unittest.TestCase):
             collection_field.Sequence(fields.String(required=True), required=True),
         )
 
+    def test_tuple_from_typing_wo_args(self):
+        self.assertFieldsEqual(
+            field_for_schema(Tuple),
+            collection_field.Sequence(
+                fields.Raw(required=True, allow_none=True), required=True
+            ),
+        )
+
     @unittest.skipIf(sys.version_info < (3, 9), "PEP 585 unsupported")
     def test_homogeneous_tuple(self):
         self.assertFieldsEqual(